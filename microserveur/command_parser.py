@@ -4,12 +4,13 @@ from __future__ import annotations
 
 import re
 import unicodedata
-from dataclasses import asdict, dataclass
-from decimal import Decimal, InvalidOperation
-from typing import Optional
+from dataclasses import dataclass
+from decimal import Decimal
+from functools import lru_cache
+from typing import Optional, Union
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParsedOrder:
     side: str
     symbol: str
@@ -23,7 +24,19 @@ class ParsedOrder:
     activation_price: Optional[str] = None
 
     def dict(self) -> dict[str, Optional[str]]:
-        return asdict(self)
+        # Every field is a str or None, so the deep copy done by asdict() is not needed.
+        return {
+            "side": self.side,
+            "symbol": self.symbol,
+            "order_type": self.order_type,
+            "quantity": self.quantity,
+            "price": self.price,
+            "time_in_force": self.time_in_force,
+            "quote_asset": self.quote_asset,
+            "quote": self.quote,
+            "callback": self.callback,
+            "activation_price": self.activation_price,
+        }
 
     def model_dump(self) -> dict[str, Optional[str]]:
         return self.dict()
@@ -33,37 +46,43 @@ class CommandParsingError(Exception):
     """Raised when a free-form command cannot be understood."""
 
 
+SIDE_BUY = "BUY"
+SIDE_SELL = "SELL"
+TYPE_MARKET = "MARKET"
+TYPE_LIMIT = "LIMIT"
+TIF_GTC = "GTC"
+
 RAW_SIDE_KEYWORDS = {
-    "buy": "BUY",
-    "sell": "SELL",
-    "acheter": "BUY",
-    "achete": "BUY",
-    "achète": "BUY",
-    "achetez": "BUY",
-    "achetons": "BUY",
-    "vendre": "SELL",
-    "vend": "SELL",
-    "vends": "SELL",
-    "vendez": "SELL",
+    "buy": SIDE_BUY,
+    "sell": SIDE_SELL,
+    "acheter": SIDE_BUY,
+    "achete": SIDE_BUY,
+    "achète": SIDE_BUY,
+    "achetez": SIDE_BUY,
+    "achetons": SIDE_BUY,
+    "vendre": SIDE_SELL,
+    "vend": SIDE_SELL,
+    "vends": SIDE_SELL,
+    "vendez": SIDE_SELL,
 }
 
 RAW_ORDER_TYPE_KEYWORDS = {
-    "market": "MARKET",
-    "marche": "MARKET",
-    "marché": "MARKET",
-    "limit": "LIMIT",
-    "limite": "LIMIT",
+    "market": TYPE_MARKET,
+    "marche": TYPE_MARKET,
+    "marché": TYPE_MARKET,
+    "limit": TYPE_LIMIT,
+    "limite": TYPE_LIMIT,
 }
 
-
-def strip_accents(value: str) -> str:
-    normalized = unicodedata.normalize("NFKD", value)
-    return "".join(ch for ch in normalized if not unicodedata.combining(ch))
+_NONALNUM_RE = re.compile(r"[^a-z0-9]")
 
 
+@lru_cache(maxsize=4096)
 def normalize_keyword(token: str) -> str:
-    stripped = strip_accents(token).lower()
-    return re.sub(r"[^a-z0-9]", "", stripped)
+    if token.isascii():
+        return _NONALNUM_RE.sub("", token.lower())
+    # The filter already drops combining marks, so NFKD alone is enough here.
+    return _NONALNUM_RE.sub("", unicodedata.normalize("NFKD", token).lower())
 
 
 SIDE_KEYWORDS = {normalize_keyword(key): value for key, value in RAW_SIDE_KEYWORDS.items()}
@@ -102,12 +121,32 @@ ACTIVATION_PRICE_KEYWORDS = {
     normalize_keyword(key) for key in RAW_ACTIVATION_PRICE_KEYWORDS
 }
 
-ORDER_KEYWORDS = (
-    set(SIDE_KEYWORDS.keys())
-    | set(ORDER_TYPE_KEYWORDS.keys())
-    | CALLBACK_RATE_KEYWORDS
-    | ACTIVATION_PRICE_KEYWORDS
-)
+ROLE_SIDE = 1
+ROLE_ORDER_TYPE = 2
+ROLE_CALLBACK = 4
+ROLE_ACTIVATION = 8
+ORDER_KW_MASK = ROLE_SIDE | ROLE_ORDER_TYPE | ROLE_CALLBACK | ROLE_ACTIVATION
+
+
+def build_keyword_index() -> dict[str, tuple[int, Optional[str]]]:
+    """Map every normalized keyword to its role bitmask and mapped side/type value."""
+    index: dict[str, tuple[int, Optional[str]]] = {}
+    for keywords, role in (
+        (SIDE_KEYWORDS, ROLE_SIDE),
+        (ORDER_TYPE_KEYWORDS, ROLE_ORDER_TYPE),
+        (dict.fromkeys(CALLBACK_RATE_KEYWORDS), ROLE_CALLBACK),
+        (dict.fromkeys(ACTIVATION_PRICE_KEYWORDS), ROLE_ACTIVATION),
+    ):
+        for keyword, mapped in keywords.items():
+            mask, value = index.get(keyword, (0, None))
+            index[keyword] = (mask | role, mapped or value)
+    return index
+
+
+KEYWORD_INDEX = build_keyword_index()
+
+_NOT_A_KEYWORD: tuple[int, Optional[str]] = (0, None)
+
 
 KNOWN_SYMBOL_SUFFIXES = {
     "USDT",
@@ -129,22 +168,48 @@ KNOWN_SYMBOL_SUFFIXES = {
 }
 
 
+def build_suffix_trie(suffixes: set[str]) -> dict:
+    """Index suffixes by their reversed characters for right-to-left lookups."""
+    trie: dict = {}
+    for suffix in suffixes:
+        node = trie
+        for char in reversed(suffix):
+            node = node.setdefault(char, {})
+        node[None] = suffix
+    return trie
+
+
+_SUFFIX_TRIE = build_suffix_trie(KNOWN_SYMBOL_SUFFIXES)
+
+# str.endswith over a tuple runs in C and beats walking the trie when only a
+# yes/no answer is needed; the trie is kept to find the longest suffix.
+_QUOTE_SUFFIXES = tuple(KNOWN_SYMBOL_SUFFIXES)
+
+
 def is_valid_candidate(candidate: str) -> bool:
     return (
         len(candidate) >= 5
         and candidate.isalnum()
-        and any(candidate.endswith(suffix) for suffix in KNOWN_SYMBOL_SUFFIXES)
+        and candidate.endswith(_QUOTE_SUFFIXES)
     )
 
 
 def detect_quote_asset(symbol: str) -> Optional[str]:
-    for suffix in sorted(KNOWN_SYMBOL_SUFFIXES, key=len, reverse=True):
-        if symbol.endswith(suffix):
-            return suffix
-    return None
+    node = _SUFFIX_TRIE
+    match: Optional[str] = None
+    for char in reversed(symbol):
+        node = node.get(char)
+        if node is None:
+            break
+        match = node.get(None, match)
+    return match
 
 
 def decimal_to_str(value: Decimal) -> str:
+    # Small integers only: str(int) is capped at 4300 digits, and normalize()
+    # below keeps the existing rounding to the 28-digit context for big values.
+    if value.is_finite() and value.adjusted() < 28 and value == value.to_integral_value():
+        return str(int(value))
     quantized = value.normalize()
     as_str = format(quantized, "f")
     if "." in as_str:
@@ -152,122 +217,170 @@ def decimal_to_str(value: Decimal) -> str:
     return as_str or "0"
 
 
-NUMBER_PATTERN = re.compile(r"(?<![A-Za-z0-9])[+-]?\d+(?:[.,]\d+)?(?![A-Za-z0-9])")
+NUMBER_PATTERN = re.compile(r"(?<![A-Za-z0-9])[+-]?\d+(?:\.\d+)?(?![A-Za-z0-9])")
 
 
-def extract_numbers(tokens: list[str]) -> list[Decimal]:
-    return [value for _, value in extract_numbers_with_indices(tokens)]
+# One match per whitespace-separated token: bare numbers, tokens embedding
+# digits (scanned again with NUMBER_PATTERN) and plain words.
+COMMAND_PATTERN = re.compile(
+    r"(?P<num>[+-]?\d+(?:\.\d+)?)(?!\S)|(?P<mixed>\S*\d\S*)|(?P<word>\S+)"
+)
+
+
+def _canon_number(raw: str) -> tuple[str, bool]:
+    """Return the canonical form of a NUMBER_PATTERN match and whether it is > 0."""
+    if not raw.isascii():
+        # Non-ASCII digits (e.g. Arabic-Indic) still go through Decimal.
+        value = Decimal(raw)
+        return decimal_to_str(value), value > 0
+    negative = raw[0] == "-"
+    integer, _, fraction = raw.lstrip("+-").partition(".")
+    integer = integer.lstrip("0") or "0"
+    fraction = fraction.rstrip("0")
+    canonical = f"{integer}.{fraction}" if fraction else integer
+    if canonical == "0":
+        return canonical, False
+    if negative:
+        return f"-{canonical}", False
+    return canonical, True
+
+
+def tokenize_command(command: str) -> tuple[list[str], list[tuple[int, str]]]:
+    """Split a command into word tokens and the numbers found in each token.
+
+    Decimal commas must already be turned into dots. Tokens that are a bare
+    number are kept as empty words so indices stay aligned.
+    """
+    words: list[str] = []
+    numbers: list[tuple[int, str]] = []
+    for index, match in enumerate(COMMAND_PATTERN.finditer(command)):
+        token = match.group()
+        kind = match.lastgroup
+        if kind == "num":
+            numbers.append((index, token))
+            words.append("")
+            continue
+        if kind == "mixed":
+            numbers.extend((index, number.group()) for number in NUMBER_PATTERN.finditer(token))
+        words.append(token)
+    return words, numbers
 
 
-def extract_numbers_with_indices(tokens: list[str]) -> list[tuple[int, Decimal]]:
-    numbers: list[tuple[int, Decimal]] = []
-    for index, token in enumerate(tokens):
-        for match in NUMBER_PATTERN.finditer(token):
-            normalized = match.group().replace(",", ".")
-            try:
-                numbers.append((index, Decimal(normalized)))
-            except InvalidOperation:
-                continue
-    return numbers
+_NONALNUM_ASCII_RE = re.compile(r"[^A-Za-z0-9]")
 
 
+@lru_cache(maxsize=4096)
 def clean_symbol_token(token: str) -> str:
-    return re.sub(r"[^A-Za-z0-9]", "", strip_accents(token))
+    if token.isascii():
+        return _NONALNUM_ASCII_RE.sub("", token)
+    return _NONALNUM_ASCII_RE.sub("", unicodedata.normalize("NFKD", token))
 
 
-def extract_symbol(raw_tokens: list[str], keyword_tokens: list[str]) -> Optional[str]:
-    cleaned_tokens = [clean_symbol_token(token) for token in raw_tokens]
-    for cleaned, keyword_token in zip(cleaned_tokens, keyword_tokens):
-        if not cleaned:
-            continue
-        if keyword_token in ORDER_KEYWORDS:
-            continue
-        if not any(char.isalpha() for char in cleaned):
+def extract_symbol(
+    cleaned_tokens: list[str], has_alpha: list[bool], roles: list[int]
+) -> Optional[str]:
+    for cleaned, alpha, role in zip(cleaned_tokens, has_alpha, roles):
+        if not alpha or role & ORDER_KW_MASK:
             continue
         candidate = cleaned.upper()
         if is_valid_candidate(candidate):
             return candidate
     for idx in range(len(cleaned_tokens) - 1):
-        first = cleaned_tokens[idx]
-        second = cleaned_tokens[idx + 1]
-        first_keyword = keyword_tokens[idx]
-        second_keyword = keyword_tokens[idx + 1]
         if (
-            not first
-            or not second
-            or first_keyword in ORDER_KEYWORDS
-            or second_keyword in ORDER_KEYWORDS
+            not has_alpha[idx]
+            or not has_alpha[idx + 1]
+            or roles[idx] & ORDER_KW_MASK
+            or roles[idx + 1] & ORDER_KW_MASK
         ):
             continue
-        if not any(char.isalpha() for char in first) or not any(char.isalpha() for char in second):
-            continue
-        candidate = f"{first}{second}".upper()
+        candidate = f"{cleaned_tokens[idx]}{cleaned_tokens[idx + 1]}".upper()
         if is_valid_candidate(candidate):
             return candidate
     return None
 
 
-def parse_trade_command(command: str) -> ParsedOrder:
-    raw_tokens = command.strip().split()
+def _parse_trade_command_impl(command: str) -> ParsedOrder:
+    raw_tokens, raw_numbers = tokenize_command(command)
     keyword_tokens = [normalize_keyword(token) for token in raw_tokens]
+    cleaned_tokens = [clean_symbol_token(token) for token in raw_tokens]
+    # Cleaned tokens only hold ASCII letters and digits, so anything
+    # non-empty that is not all digits contains a letter.
+    has_alpha = [bool(cleaned) and not cleaned.isdigit() for cleaned in cleaned_tokens]
+
+    roles: list[int] = []
+    side: Optional[str] = None
+    order_type: Optional[str] = None
+    callback_indices: list[int] = []
+    activation_indices: list[int] = []
+    for idx, token in enumerate(keyword_tokens):
+        role, value = KEYWORD_INDEX.get(token, _NOT_A_KEYWORD)
+        roles.append(role)
+        if not role:
+            continue
+        if role & ROLE_SIDE and side is None:
+            side = value
+        if role & ROLE_ORDER_TYPE and order_type is None:
+            order_type = value
+        if role & ROLE_CALLBACK:
+            callback_indices.append(idx)
+        if role & ROLE_ACTIVATION:
+            activation_indices.append(idx)
 
-    side = next((SIDE_KEYWORDS[token] for token in keyword_tokens if token in SIDE_KEYWORDS), None)
     if not side:
         raise CommandParsingError("Impossible de déterminer si l'ordre est un achat ou une vente.")
+    if order_type is None:
+        order_type = TYPE_MARKET
 
-    order_type = next(
-        (ORDER_TYPE_KEYWORDS[token] for token in keyword_tokens if token in ORDER_TYPE_KEYWORDS),
-        "MARKET",
-    )
-
-    symbol = extract_symbol(raw_tokens, keyword_tokens)
+    symbol = extract_symbol(cleaned_tokens, has_alpha, roles)
     if not symbol:
         raise CommandParsingError("Impossible de déterminer le symbole à trader.")
 
-    numbers_with_indices = extract_numbers_with_indices(raw_tokens)
+    numbers_with_indices = [
+        (index, *_canon_number(raw))
+        for index, raw in raw_numbers
+    ]
     if not numbers_with_indices:
         raise CommandParsingError("Impossible de déterminer la quantité à trader.")
 
-    quantity_index, quantity = numbers_with_indices[0]
-    if quantity <= 0:
+    quantity_index, quantity, quantity_positive = numbers_with_indices[0]
+    if not quantity_positive:
         raise CommandParsingError("La quantité doit être supérieure à zéro.")
 
     used_number_indices = {quantity_index}
 
-    price: Optional[Decimal] = None
+    price: Optional[str] = None
     price_index: Optional[int] = None
-    if order_type == "LIMIT":
+    if order_type == TYPE_LIMIT:
         if len(numbers_with_indices) < 2:
             raise CommandParsingError("Une commande limite nécessite un prix.")
-        price_index, price = numbers_with_indices[1]
-        if price <= 0:
+        price_index, price, price_positive = numbers_with_indices[1]
+        if not price_positive:
             raise CommandParsingError("Le prix doit être supérieur à zéro.")
         used_number_indices.add(price_index)
 
-    def find_number_after_keywords(keywords: set[str]) -> Optional[Decimal]:
-        for idx, keyword in enumerate(keyword_tokens):
-            if keyword not in keywords:
-                continue
-            for token_index, value in numbers_with_indices:
+    def find_number_after_keywords(keyword_indices: list[int]) -> Optional[tuple[str, bool]]:
+        for idx in keyword_indices:
+            for token_index, value, positive in numbers_with_indices:
                 if token_index in used_number_indices:
                     continue
                 if token_index >= idx:
                     used_number_indices.add(token_index)
-                    return value
+                    return value, positive
         return None
 
-    callback_value = find_number_after_keywords(CALLBACK_RATE_KEYWORDS)
-    if callback_value is not None and callback_value <= 0:
-        raise CommandParsingError("Le callback doit être supérieur à zéro.")
+    callback_str: Optional[str] = None
+    callback_match = find_number_after_keywords(callback_indices)
+    if callback_match is not None:
+        callback_str, callback_positive = callback_match
+        if not callback_positive:
+            raise CommandParsingError("Le callback doit être supérieur à zéro.")
 
-    activation_value = find_number_after_keywords(ACTIVATION_PRICE_KEYWORDS)
-    if activation_value is not None and activation_value <= 0:
-        raise CommandParsingError("Le prix d'activation doit être supérieur à zéro.")
-
-    callback_str = decimal_to_str(callback_value) if callback_value is not None else None
-    activation_str = (
-        decimal_to_str(activation_value) if activation_value is not None else None
-    )
+    activation_str: Optional[str] = None
+    activation_match = find_number_after_keywords(activation_indices)
+    if activation_match is not None:
+        activation_str, activation_positive = activation_match
+        if not activation_positive:
+            raise CommandParsingError("Le prix d'activation doit être supérieur à zéro.")
 
     quote_asset = detect_quote_asset(symbol)
 
@@ -275,9 +388,9 @@ def parse_trade_command(command: str) -> ParsedOrder:
         side=side,
         symbol=symbol,
         order_type=order_type,
-        quantity=decimal_to_str(quantity),
-        price=decimal_to_str(price) if price is not None else None,
-        time_in_force="GTC" if order_type == "LIMIT" else None,
+        quantity=quantity,
+        price=price,
+        time_in_force=TIF_GTC if order_type == TYPE_LIMIT else None,
         quote_asset=quote_asset,
         quote=quote_asset,
         callback=callback_str,
@@ -285,8 +398,39 @@ def parse_trade_command(command: str) -> ParsedOrder:
     )
 
 
+@lru_cache(maxsize=1024)
+def _parse_trade_command_cached(command: str) -> tuple[bool, Union[ParsedOrder, str]]:
+    # Failures are cached by message so repeated invalid commands skip parsing too.
+    try:
+        return True, _parse_trade_command_impl(command)
+    except CommandParsingError as exc:
+        return False, str(exc)
+
+
+def parse_trade_command(command: str) -> ParsedOrder:
+    # Decimal commas become dots up front; commas carry no meaning elsewhere
+    # since keywords and symbols drop punctuation. Case is left alone: some
+    # characters (İ, Kelvin sign) lowercase to ASCII letters or combining
+    # marks, which would change number boundaries.
+    normalized = command.strip().replace(",", ".")
+    ok, result = _parse_trade_command_cached(normalized)
+    if not ok:
+        raise CommandParsingError(result)
+    return result
+
+
+# Mirror the functools.lru_cache API so callers and tests can reset the cache.
+parse_trade_command.cache_clear = _parse_trade_command_cached.cache_clear
+parse_trade_command.cache_info = _parse_trade_command_cached.cache_info
+
+
 __all__ = [
     "CommandParsingError",
     "ParsedOrder",
+    "SIDE_BUY",
+    "SIDE_SELL",
+    "TIF_GTC",
+    "TYPE_LIMIT",
+    "TYPE_MARKET",
     "parse_trade_command",
 ]
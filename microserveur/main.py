@@ -1,5 +1,8 @@
+import asyncio
+from contextlib import contextmanager
 from functools import lru_cache
-from typing import Optional
+from queue import Empty, Queue
+from typing import Iterator, Optional
 
 from fastapi import FastAPI, Request
 from pydantic import BaseModel, Field, field_validator
@@ -7,9 +10,9 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 from binance.client import Client
 from binance.exceptions import BinanceAPIException, BinanceRequestException
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
-from command_parser import CommandParsingError, parse_trade_command
+from command_parser import TIF_GTC, TYPE_LIMIT, CommandParsingError, parse_trade_command
 
 
 class Settings(BaseSettings):
@@ -47,6 +50,31 @@ def create_client(use_testnet: bool) -> Client:
     return Client(settings.api_key, settings.api_secret)
 
 
+# Idle clients per environment. A client is checked out by one thread at a
+# time: python-binance keeps the last reply on the instance (self.response),
+# so sharing one across concurrent orders could mix up their responses.
+_client_pools: dict[bool, Queue[Client]] = {True: Queue(), False: Queue()}
+
+
+@contextmanager
+def checkout_client(use_testnet: bool) -> Iterator[Client]:
+    """Prête un client Binance inutilisé, créé au besoin, puis le remet au pool."""
+    pool = _client_pools[use_testnet]
+    try:
+        client = pool.get_nowait()
+    except Empty:
+        client = create_client(use_testnet)
+    try:
+        yield client
+    finally:
+        pool.put(client)
+
+
+def send_order(use_testnet: bool, order_payload: dict) -> dict:
+    with checkout_client(use_testnet) as client:
+        return client.create_order(**order_payload)
+
+
 def attendre_commande() -> str:
     """Attend une saisie utilisateur et renvoie le texte saisi."""
     try:
@@ -55,18 +83,18 @@ def attendre_commande() -> str:
         raise CommandParsingError("Aucune commande saisie.") from exc
 
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 
-def success_response(message: str, data: Optional[dict] = None, status_code: int = 200) -> JSONResponse:
-    return JSONResponse(
+def success_response(message: str, data: Optional[dict] = None, status_code: int = 200) -> ORJSONResponse:
+    return ORJSONResponse(
         status_code=status_code,
         content={"status": "success", "message": message, "data": data},
     )
 
 
-def error_response(status_code: int, message: str, data: Optional[dict] = None) -> JSONResponse:
-    return JSONResponse(
+def error_response(status_code: int, message: str, data: Optional[dict] = None) -> ORJSONResponse:
+    return ORJSONResponse(
         status_code=status_code,
         content={"status": "error", "message": message, "data": data},
     )
@@ -75,35 +103,48 @@ def error_response(status_code: int, message: str, data: Optional[dict] = None)
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     return error_response(422, "Requête invalide.", {"errors": exc.errors()})
 
 
+@app.on_event("shutdown")
+def close_clients() -> None:
+    for pool in _client_pools.values():
+        while True:
+            try:
+                client = pool.get_nowait()
+            except Empty:
+                break
+            try:
+                client.close_connection()
+            except Exception:
+                pass
+
+
 @app.get("/")
 def read_root():
     return success_response("Service prêt.")
 
 
 @app.post("/orders")
-def place_order(payload: CommandRequest):
+async def place_order(payload: CommandRequest):
     try:
         parsed = parse_trade_command(payload.command)
     except CommandParsingError as exc:
         return error_response(400, str(exc))
 
-    client = create_client(payload.testnet)
     order_payload = {
         "symbol": parsed.symbol,
         "side": parsed.side,
         "type": parsed.order_type,
         "quantity": parsed.quantity,
     }
-    if parsed.order_type == "LIMIT":
+    if parsed.order_type == TYPE_LIMIT:
         if parsed.price is None:
             return error_response(
                 500, "Le prix de l'ordre limite est manquant après l'analyse."
             )
-        order_payload["timeInForce"] = parsed.time_in_force or "GTC"
+        order_payload["timeInForce"] = parsed.time_in_force or TIF_GTC
         order_payload["price"] = parsed.price
 
     if parsed.callback is not None:
@@ -113,7 +154,7 @@ def place_order(payload: CommandRequest):
         order_payload["activationPrice"] = parsed.activation_price
 
     try:
-        response = client.create_order(**order_payload)
+        response = await asyncio.to_thread(send_order, payload.testnet, order_payload)
     except (BinanceAPIException, BinanceRequestException) as exc:
         error_details = {
             "code": getattr(exc, "code", None),
@@ -122,11 +163,6 @@ def place_order(payload: CommandRequest):
         return error_response(502, "Erreur renvoyée par Binance.", error_details)
     except Exception as exc:  # pragma: no cover - unexpected errors
         return error_response(500, "Erreur inattendue lors de l'envoi de l'ordre.")
-    finally:
-        try:
-            client.close_connection()
-        except Exception:
-            pass
 
     return success_response(
         "Ordre transmis avec succès.",
@@ -0,0 +1,80 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("binance")
+httpx = pytest.importorskip("httpx")
+
+import main
+
+
+class FakeClient:
+    """Mimics python-binance keeping the last reply on the instance."""
+
+    def __init__(self, barrier: threading.Barrier) -> None:
+        self.barrier = barrier
+        self.response = None
+        self.closed = False
+
+    def create_order(self, **params: str) -> dict:
+        self.response = {"symbol": params["symbol"], "quantity": params["quantity"]}
+        self.barrier.wait(timeout=5)
+        time.sleep(0.01)
+        return self.response
+
+    def close_connection(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def fake_clients(monkeypatch: pytest.MonkeyPatch) -> list[FakeClient]:
+    main.close_clients()
+    barrier = threading.Barrier(2)
+    created: list[FakeClient] = []
+
+    def create_client(use_testnet: bool) -> FakeClient:
+        client = FakeClient(barrier)
+        created.append(client)
+        return client
+
+    monkeypatch.setattr(main, "create_client", create_client)
+    yield created
+    main.close_clients()
+
+
+def test_concurrent_orders_do_not_share_a_client(fake_clients: list[FakeClient]) -> None:
+    async def post_both() -> list[httpx.Response]:
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await asyncio.gather(
+                client.post("/orders", json={"command": "achète 1 btcusdt"}),
+                client.post("/orders", json={"command": "vend 2 ethusdt"}),
+            )
+
+    first, second = asyncio.run(post_both())
+
+    assert first.json()["data"]["binance_response"] == {"symbol": "BTCUSDT", "quantity": "1"}
+    assert second.json()["data"]["binance_response"] == {"symbol": "ETHUSDT", "quantity": "2"}
+    assert len(fake_clients) == 2
+
+
+def test_idle_clients_are_reused_and_closed_on_shutdown(fake_clients: list[FakeClient]) -> None:
+    order = {"symbol": "BTCUSDT", "quantity": "1"}
+    threads = [
+        threading.Thread(target=main.send_order, args=(True, order)) for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(fake_clients) == 2
+
+    fake_clients[0].barrier = fake_clients[1].barrier = threading.Barrier(1)
+    main.send_order(True, order)
+    assert len(fake_clients) == 2
+
+    main.close_clients()
+    assert all(client.closed for client in fake_clients)
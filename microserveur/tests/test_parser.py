@@ -1,78 +1,78 @@
-from pathlib import Path
-import sys
+from dataclasses import asdict
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
+import command_parser
 from command_parser import CommandParsingError, ParsedOrder, parse_trade_command
 
 
-@pytest.mark.parametrize(
-    "command,expected",
-    [
-        (
-            "Achète 0,1 BTCUSDT au marché",
-            ParsedOrder(
-                side="BUY",
-                symbol="BTCUSDT",
-                order_type="MARKET",
-                quantity="0.1",
-                quote_asset="USDT",
-                quote="USDT",
-            ),
+EXPECTED_CASES = (
+    (
+        "Achète 0,1 BTCUSDT au marché",
+        ParsedOrder(
+            side="BUY",
+            symbol="BTCUSDT",
+            order_type="MARKET",
+            quantity="0.1",
+            quote_asset="USDT",
+            quote="USDT",
         ),
-        (
-            "Vend 2 eth usdt limit à 2300",
-            ParsedOrder(
-                side="SELL",
-                symbol="ETHUSDT",
-                order_type="LIMIT",
-                quantity="2",
-                price="2300",
-                time_in_force="GTC",
-                quote_asset="USDT",
-                quote="USDT",
-            ),
+    ),
+    (
+        "Vend 2 eth usdt limit à 2300",
+        ParsedOrder(
+            side="SELL",
+            symbol="ETHUSDT",
+            order_type="LIMIT",
+            quantity="2",
+            price="2300",
+            time_in_force="GTC",
+            quote_asset="USDT",
+            quote="USDT",
         ),
-        (
-            "achetez 5 sol usdt",
-            ParsedOrder(
-                side="BUY",
-                symbol="SOLUSDT",
-                order_type="MARKET",
-                quantity="5",
-                quote_asset="USDT",
-                quote="USDT",
-            ),
+    ),
+    (
+        "achetez 5 sol usdt",
+        ParsedOrder(
+            side="BUY",
+            symbol="SOLUSDT",
+            order_type="MARKET",
+            quantity="5",
+            quote_asset="USDT",
+            quote="USDT",
         ),
-        (
-            "achète 1 op usdt",
-            ParsedOrder(
-                side="BUY",
-                symbol="OPUSDT",
-                order_type="MARKET",
-                quantity="1",
-                quote_asset="USDT",
-                quote="USDT",
-            ),
+    ),
+    (
+        "achète 1 op usdt",
+        ParsedOrder(
+            side="BUY",
+            symbol="OPUSDT",
+            order_type="MARKET",
+            quantity="1",
+            quote_asset="USDT",
+            quote="USDT",
         ),
-        (
-            "vend 2 santos usdt",
-            ParsedOrder(
-                side="SELL",
-                symbol="SANTOSUSDT",
-                order_type="MARKET",
-                quantity="2",
-                quote_asset="USDT",
-                quote="USDT",
-            ),
+    ),
+    (
+        "vend 2 santos usdt",
+        ParsedOrder(
+            side="SELL",
+            symbol="SANTOSUSDT",
+            order_type="MARKET",
+            quantity="2",
+            quote_asset="USDT",
+            quote="USDT",
         ),
-    ],
+    ),
 )
+
+EXPECTED_CASE_IDS = ("market_buy_btc", "limit_sell_eth", "buy_sol", "buy_op", "sell_santos")
+
+
+@pytest.mark.parametrize("command,expected", EXPECTED_CASES, ids=EXPECTED_CASE_IDS)
 def test_parse_trade_command_success(command: str, expected: ParsedOrder) -> None:
     parsed = parse_trade_command(command)
-    assert parsed.model_dump() == expected.model_dump()
+    assert parsed == expected
 
 
 def test_parse_trade_command_detects_quote_with_separator() -> None:
@@ -111,3 +111,82 @@ def test_parse_trade_command_rejects_negative_callback() -> None:
 def test_parse_trade_command_rejects_negative_activation_price() -> None:
     with pytest.raises(CommandParsingError):
         parse_trade_command("acheter 1 btcusdt activation -100")
+
+
+def test_parse_trade_command_handles_uppercase_accents() -> None:
+    parsed = parse_trade_command("ACHÈTE 1 ETHUSDT AU MARCHÉ")
+    assert parsed.side == "BUY"
+    assert parsed.order_type == "MARKET"
+
+
+def test_detect_quote_asset_prefers_longest_suffix(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        command_parser, "_SUFFIX_TRIE", command_parser.build_suffix_trie({"USD", "FDUSD"})
+    )
+    assert command_parser.detect_quote_asset("BTCFDUSD") == "FDUSD"
+    assert command_parser.detect_quote_asset("BTCUSD") == "USD"
+    assert command_parser.detect_quote_asset("BTCEUR") is None
+
+
+def test_parse_trade_command_reuses_cached_result() -> None:
+    parse_trade_command.cache_clear()
+    first = parse_trade_command("vend 2 eth usdt limit à 2300")
+    second = parse_trade_command("  vend 2 eth usdt limit à 2300  ")
+    assert first is second
+    assert parse_trade_command.cache_info().hits == 1
+
+
+def test_parse_trade_command_repeated_failure_still_raises() -> None:
+    for _ in range(2):
+        with pytest.raises(CommandParsingError):
+            parse_trade_command("achète 1 au marché")
+
+
+def test_parse_trade_command_ignores_digits_inside_symbol() -> None:
+    parsed = parse_trade_command("acheter 1inchusdt 3 limit 0,5")
+    assert parsed.symbol == "1INCHUSDT"
+    assert parsed.quantity == "3"
+    assert parsed.price == "0.5"
+
+
+def test_parse_trade_command_canonicalizes_numbers() -> None:
+    parsed = parse_trade_command("vendre +007,50 btcusdt limit 25000.000")
+    assert parsed.quantity == "7.5"
+    assert parsed.price == "25000"
+
+
+def test_parse_trade_command_rejects_zero_quantity() -> None:
+    with pytest.raises(CommandParsingError):
+        parse_trade_command("acheter 0,00 btcusdt")
+
+
+def test_parsed_order_dict_matches_all_fields() -> None:
+    parsed = parse_trade_command("vend 3 btcusdt callback 1.5 activation 25000")
+    assert parsed.dict() == asdict(parsed)
+
+
+def test_parse_trade_command_ignores_case_and_decimal_separator() -> None:
+    first = parse_trade_command("Achète 0,1 BTCUSDT au marché")
+    second = parse_trade_command("achète 0.1 btcusdt AU MARCHÉ")
+    assert first == second
+
+
+@pytest.mark.parametrize(
+    "command,field,expected",
+    [
+        ("achète 2İ btcusdt", "quantity", "2"),
+        ("sell 0,5 eth usdt limit 5\u212a", "price", "5"),
+        ("achète 1 btcusdt callback 1İ", "callback", "1"),
+    ],
+    ids=["dotted_capital_i", "kelvin_sign", "callback_dotted_capital_i"],
+)
+def test_parse_trade_command_keeps_numbers_before_case_changing_letters(
+    command: str, field: str, expected: str
+) -> None:
+    parsed = parse_trade_command(command)
+    assert getattr(parsed, field) == expected
+
+
+def test_parse_trade_command_handles_huge_non_ascii_quantity() -> None:
+    parsed = parse_trade_command("buy " + "١" * 5000 + " btcusdt")
+    assert parsed.quantity == "1" * 28 + "0" * 4972